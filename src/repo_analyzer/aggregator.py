@@ -1,94 +1,237 @@
 # ABOUTME: Weekly aggregation logic for commit data and rolling window analysis.
 # ABOUTME: Groups commits by ISO week and computes aggregate statistics and 12-week rolling windows.
 
+from bisect import bisect_left, insort
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict
-from typing import List
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable, Iterator, List
 
 from .models import CommitData, WeeklyAggregate, RollingWindowAggregate
 
 
+# Offset from a week's Monday-midnight start to its Sunday 23:59:59 end
+_WEEK_END_OFFSET = timedelta(days=6, hours=23, minutes=59, seconds=59)
+
+
+def _iso_monday_utc(date: datetime) -> datetime:
+    """Get the Monday (start) of the ISO week for a given date.
+
+    Args:
+        date: Datetime to get week start for
+
+    Returns:
+        Datetime representing Monday at 00:00:00 UTC of the ISO week
+    """
+    return _week_start_for_day(date.year, date.month, date.day)
+
+
+@lru_cache(maxsize=None)
+def _week_start_for_day(year: int, month: int, day: int) -> datetime:
+    """Get the Monday at 00:00:00 UTC of the ISO week containing a date.
+
+    Memoized per calendar day: commit histories revisit the same handful
+    of days constantly, so repeat lookups skip the ordinal arithmetic and
+    datetime construction entirely.
+    """
+    # Proleptic Gregorian ordinal 1 (0001-01-01) is a Monday, so the
+    # Monday of any date's ISO week is one integer-modulo step away.
+    ordinal = datetime(year, month, day).toordinal()
+    monday = datetime.fromordinal(ordinal - (ordinal - 1) % 7)
+
+    # fromordinal yields naive midnight; pin to UTC
+    return monday.replace(tzinfo=timezone.utc)
+
+
+class _WeekAcc:
+    """Mutable per-week accumulator used while bucketing commits.
+
+    A __slots__ class instead of a nested dict: updating a week costs one
+    dict lookup plus direct attribute mutations rather than one dict
+    lookup per field.
+    """
+
+    __slots__ = ('commits', 'commit_count', 'authors', 'lines_added',
+                 'lines_deleted', 'versions')
+
+    def __init__(self):
+        self.commits = []
+        self.commit_count = 0
+        self.authors = set()
+        self.lines_added = 0
+        self.lines_deleted = 0
+        self.versions = set()
+
+    def add(self, commit: 'CommitData', keep_commit: bool = True) -> None:
+        """Fold one commit into the accumulator.
+
+        Args:
+            commit: CommitData to accumulate
+            keep_commit: Whether to retain the commit object itself (needed
+                for the week -> commits grouping; streaming callers skip it)
+        """
+        if keep_commit:
+            self.commits.append(commit)
+        self.commit_count += 1
+        self.authors.add(commit.author_name)
+        self.lines_added += commit.lines_added
+        self.lines_deleted += commit.lines_deleted
+
+        if commit.version is not None:
+            self.versions.add(commit.version)
+
+
 class WeeklyAggregator:
     """Aggregates commit data into weekly summaries."""
 
+    def __init__(self):
+        # Week-bucketed commits from the last aggregate() call, kept so
+        # RollingWindowAggregator can reuse the grouping instead of
+        # re-bucketing every commit.
+        self.commits_by_week: dict = {}
+        # Per-week author sets from the last aggregate()/finalize() call;
+        # enough for RollingWindowAggregator.aggregate_weekly to dedup
+        # authors without the commits themselves.
+        self.authors_by_week: dict = {}
+        # Accumulators fed through update() until finalize() is called
+        self._weeks_data: dict = defaultdict(_WeekAcc)
+
     def aggregate(self, commits: List[CommitData]) -> List[WeeklyAggregate]:
         """Group commits by ISO week and compute aggregates.
 
+        As a side effect, stores the week -> commits grouping on
+        ``self.commits_by_week`` for reuse by RollingWindowAggregator.
+
         Args:
             commits: List of CommitData objects to aggregate
 
         Returns:
             List of WeeklyAggregate objects sorted by week_start
         """
+        self.commits_by_week = {}
+        self.authors_by_week = {}
         if not commits:
             return []
 
         # Group commits by ISO week
-        weeks_data = defaultdict(lambda: {
-            'commits': [],
-            'authors': set(),
-            'lines_added': 0,
-            'lines_deleted': 0,
-            'versions': set()
-        })
+        weeks_data = defaultdict(_WeekAcc)
 
         for commit in commits:
-            week_start = self._get_week_start(commit.commit_date)
-
-            weeks_data[week_start]['commits'].append(commit)
-            weeks_data[week_start]['authors'].add(commit.author_name)
-            weeks_data[week_start]['lines_added'] += commit.lines_added
-            weeks_data[week_start]['lines_deleted'] += commit.lines_deleted
-
-            if commit.version is not None:
-                weeks_data[week_start]['versions'].add(commit.version)
+            weeks_data[_iso_monday_utc(commit.commit_date)].add(commit)
 
         # Create WeeklyAggregate objects
-        aggregates = []
-        for week_start, data in weeks_data.items():
-            aggregate = WeeklyAggregate(
-                week_start=week_start,
-                total_commits=len(data['commits']),
-                unique_authors=len(data['authors']),
-                total_lines_added=data['lines_added'],
-                total_lines_deleted=data['lines_deleted'],
-                versions_released=sorted(list(data['versions']))
-            )
-            aggregates.append(aggregate)
+        aggregates = [
+            self._finish_week(week_start, acc)
+            for week_start, acc in weeks_data.items()
+        ]
 
         # Sort by week_start
         aggregates.sort(key=lambda x: x.week_start)
 
+        self.commits_by_week = {
+            week_start: acc.commits for week_start, acc in weeks_data.items()
+        }
+        self.authors_by_week = {
+            week_start: acc.authors for week_start, acc in weeks_data.items()
+        }
+
         return aggregates
 
-    def _get_week_start(self, date: datetime) -> datetime:
-        """Get the Monday (start) of the ISO week for a given date.
+    def update(self, commit: CommitData) -> None:
+        """Fold one commit into the running weekly accumulators.
+
+        Incremental counterpart to aggregate() for streaming pipelines:
+        call once per commit as the repository walk produces it, then
+        finalize() to obtain the aggregates. The commit object itself is
+        not retained, so peak memory stays O(weeks + authors) rather than
+        O(commits).
 
         Args:
-            date: Datetime to get week start for
+            commit: CommitData object to accumulate
+        """
+        self._weeks_data[_iso_monday_utc(commit.commit_date)].add(
+            commit, keep_commit=False
+        )
+
+    def finalize(self) -> List[WeeklyAggregate]:
+        """Build the aggregates for all commits passed to update().
+
+        Also populates ``self.authors_by_week`` for rolling-window author
+        deduplication, and resets the running accumulators.
 
         Returns:
-            Datetime representing Monday at 00:00:00 UTC of the ISO week
+            List of WeeklyAggregate objects sorted by week_start
         """
-        # Get ISO calendar info (year, week, weekday)
-        # weekday: 1=Monday, 7=Sunday
-        iso_year, iso_week, iso_weekday = date.isocalendar()
-
-        # Calculate the Monday of this ISO week
-        # Start from the given date and go back (weekday - 1) days
-        days_from_monday = iso_weekday - 1
-        monday = date - timedelta(days=days_from_monday)
-
-        # Set to midnight UTC
-        week_start = datetime(
-            monday.year,
-            monday.month,
-            monday.day,
-            0, 0, 0,
-            tzinfo=timezone.utc
-        )
+        weeks_data = self._weeks_data
+        self._weeks_data = defaultdict(_WeekAcc)
+
+        aggregates = [
+            self._finish_week(week_start, acc)
+            for week_start, acc in weeks_data.items()
+        ]
+        aggregates.sort(key=lambda x: x.week_start)
+
+        self.commits_by_week = {}
+        self.authors_by_week = {
+            week_start: acc.authors for week_start, acc in weeks_data.items()
+        }
+
+        return aggregates
+
+    def aggregate_stream(
+        self,
+        commits: Iterable[CommitData]
+    ) -> Iterator[WeeklyAggregate]:
+        """Aggregate date-ordered commits week by week, yielding as it goes.
+
+        Unlike aggregate(), this holds only the current week's accumulator
+        in memory, so a large history can be streamed straight from the
+        repository walk without materializing the full commit list.
+        Commits must arrive sorted by commit_date; each WeeklyAggregate is
+        yielded as soon as the stream crosses its week boundary.
+
+        Args:
+            commits: Iterable of CommitData objects sorted by commit_date
+
+        Yields:
+            WeeklyAggregate objects in week_start order
+        """
+        current_week = None
+        acc = None
+
+        for commit in commits:
+            week_start = _iso_monday_utc(commit.commit_date)
 
-        return week_start
+            if week_start != current_week:
+                if acc is not None:
+                    yield self._finish_week(current_week, acc)
+                current_week = week_start
+                acc = _WeekAcc()
+
+            acc.add(commit, keep_commit=False)
+
+        if acc is not None:
+            yield self._finish_week(current_week, acc)
+
+    def _finish_week(self, week_start: datetime, acc: _WeekAcc) -> WeeklyAggregate:
+        """Build the WeeklyAggregate for a completed week accumulator.
+
+        Args:
+            week_start: Monday 00:00:00 UTC of the completed week
+            acc: Accumulator with the week's commits
+
+        Returns:
+            WeeklyAggregate for the week
+        """
+        return WeeklyAggregate(
+            week_start=week_start,
+            total_commits=acc.commit_count,
+            unique_authors=len(acc.authors),
+            total_lines_added=acc.lines_added,
+            total_lines_deleted=acc.lines_deleted,
+            versions_released=sorted(acc.versions)
+        )
 
 
 class RollingWindowAggregator:
@@ -99,7 +242,8 @@ class RollingWindowAggregator:
     def aggregate(
         self,
         commits: List[CommitData],
-        weekly_aggregates: List[WeeklyAggregate]
+        weekly_aggregates: List[WeeklyAggregate],
+        commits_by_week: dict = None
     ) -> List[RollingWindowAggregate]:
         """Compute 12-week rolling windows.
 
@@ -109,6 +253,9 @@ class RollingWindowAggregator:
         Args:
             commits: List of CommitData objects
             weekly_aggregates: List of WeeklyAggregate objects sorted by week_start
+            commits_by_week: Optional week -> commits grouping (e.g. from
+                WeeklyAggregator.commits_by_week); rebuilt from commits
+                when omitted
 
         Returns:
             List of RollingWindowAggregate objects, one per week
@@ -116,23 +263,129 @@ class RollingWindowAggregator:
         if not weekly_aggregates:
             return []
 
-        # Group commits by week_start for deduplication
-        commits_by_week = self._group_commits_by_week(commits)
+        # Group commits by week_start for deduplication, unless the
+        # caller already has the grouping from the weekly pass
+        if commits_by_week is None:
+            commits_by_week = self._group_commits_by_week(commits)
+
+        # Reduce the grouped commits to per-week author and version sets;
+        # that is all the window dedup needs
+        authors_by_week = {}
+        versions_by_week = {}
+        for week_start, week_commits in commits_by_week.items():
+            authors_by_week[week_start] = {
+                commit.author_name for commit in week_commits
+            }
+            versions_by_week[week_start] = {
+                commit.version for commit in week_commits
+                if commit.version is not None
+            }
+
+        return self.aggregate_weekly(
+            weekly_aggregates, authors_by_week, versions_by_week
+        )
 
-        rolling_windows = []
+    def aggregate_weekly(
+        self,
+        weekly_aggregates: List[WeeklyAggregate],
+        authors_by_week: dict,
+        versions_by_week: dict = None
+    ) -> List[RollingWindowAggregate]:
+        """Compute 12-week rolling windows from weekly data alone.
 
-        # For each week, create a rolling window
-        for i, week_agg in enumerate(weekly_aggregates):
-            # Get next 12 weeks (or fewer at end)
-            window_weeks = weekly_aggregates[i:i + self.WINDOW_SIZE_WEEKS]
+        Works without the raw commits: numeric metrics come from the
+        weekly aggregates and author deduplication from per-week author
+        sets (e.g. WeeklyAggregator.authors_by_week), so streaming
+        pipelines never need to materialize the commit list.
+
+        Args:
+            weekly_aggregates: List of WeeklyAggregate objects sorted by week_start
+            authors_by_week: Mapping of week_start to that week's author set
+            versions_by_week: Optional mapping of week_start to version set;
+                defaults to each aggregate's versions_released
+
+        Returns:
+            List of RollingWindowAggregate objects, one per week
+        """
+        if not weekly_aggregates:
+            return []
 
-            # Collect all commits in window for deduplication
-            window_commits = []
-            for week in window_weeks:
-                window_commits.extend(commits_by_week.get(week.week_start, []))
+        # Prefix sums over the weekly metrics: each window sum becomes one
+        # subtraction instead of re-summing up to 12 weeks per window.
+        cum_commits = [0, *accumulate(w.total_commits for w in weekly_aggregates)]
+        cum_added = [0, *accumulate(w.total_lines_added for w in weekly_aggregates)]
+        cum_deleted = [0, *accumulate(w.total_lines_deleted for w in weekly_aggregates)]
+
+        n = len(weekly_aggregates)
+        week_authors = [
+            authors_by_week.get(week.week_start, ()) for week in weekly_aggregates
+        ]
+        if versions_by_week is None:
+            week_versions = [week.versions_released for week in weekly_aggregates]
+        else:
+            week_versions = [
+                versions_by_week.get(week.week_start, ())
+                for week in weekly_aggregates
+            ]
+
+        # Sliding multiset of the weeks currently in the window: each
+        # author/version is counted in as its week enters and counted out
+        # as it expires, so every week is processed twice in total instead
+        # of once per window it overlaps. Entries are deleted when their
+        # count reaches zero, so len() is the live unique count.
+        author_counts: dict = {}
+        version_counts: dict = {}
+        # Live window versions kept in sorted order via bisect, so each
+        # window emits a plain copy instead of re-sorting from scratch.
+        sorted_versions: List[str] = []
+
+        def _add_week(index: int) -> None:
+            for author in week_authors[index]:
+                author_counts[author] = author_counts.get(author, 0) + 1
+            for version in week_versions[index]:
+                count = version_counts.get(version, 0)
+                version_counts[version] = count + 1
+                if count == 0:
+                    insort(sorted_versions, version)
+
+        def _remove_week(index: int) -> None:
+            for author in week_authors[index]:
+                remaining = author_counts[author] - 1
+                if remaining:
+                    author_counts[author] = remaining
+                else:
+                    del author_counts[author]
+            for version in week_versions[index]:
+                remaining = version_counts[version] - 1
+                if remaining:
+                    version_counts[version] = remaining
+                else:
+                    del version_counts[version]
+                    del sorted_versions[bisect_left(sorted_versions, version)]
 
-            # Create rolling window aggregate
-            rolling_window = self._create_window_aggregate(window_weeks, window_commits)
+        rolling_windows = []
+        covered = 0  # leading weeks currently folded into the counters
+        # Hoist the class-attribute lookup out of the hot loop
+        window_size = self.WINDOW_SIZE_WEEKS
+
+        # For each week, create a rolling window
+        for i in range(n):
+            # Window covers the next 12 weeks (or fewer at end)
+            end = min(i + window_size, n)
+            if i > 0:
+                _remove_week(i - 1)
+            while covered < end:
+                _add_week(covered)
+                covered += 1
+
+            rolling_window = self._create_window_aggregate(
+                weekly_aggregates[i:end],
+                total_commits=cum_commits[end] - cum_commits[i],
+                total_lines_added=cum_added[end] - cum_added[i],
+                total_lines_deleted=cum_deleted[end] - cum_deleted[i],
+                unique_authors=len(author_counts),
+                versions_released=list(sorted_versions),
+            )
             rolling_windows.append(rolling_window)
 
         return rolling_windows
@@ -146,28 +399,34 @@ class RollingWindowAggregator:
         Returns:
             Dictionary mapping week_start datetime to list of commits
         """
-        weekly_aggregator = WeeklyAggregator()
         commits_by_week = defaultdict(list)
 
         for commit in commits:
-            week_start = weekly_aggregator._get_week_start(commit.commit_date)
-            commits_by_week[week_start].append(commit)
+            commits_by_week[_iso_monday_utc(commit.commit_date)].append(commit)
 
         return commits_by_week
 
     def _create_window_aggregate(
         self,
         window_weeks: List[WeeklyAggregate],
-        window_commits: List[CommitData]
+        total_commits: int,
+        total_lines_added: int,
+        total_lines_deleted: int,
+        unique_authors: int,
+        versions_released: List[str],
     ) -> RollingWindowAggregate:
-        """Create a RollingWindowAggregate from weeks and commits.
+        """Create a RollingWindowAggregate from precomputed window stats.
 
         Args:
             window_weeks: List of WeeklyAggregate objects in the window
-            window_commits: List of CommitData objects in the window
+            total_commits: Commit count summed over the window
+            total_lines_added: Lines added summed over the window
+            total_lines_deleted: Lines deleted summed over the window
+            unique_authors: Deduplicated author count for the window
+            versions_released: Sorted versions released in the window
 
         Returns:
-            RollingWindowAggregate with deduplicated authors and versions
+            RollingWindowAggregate spanning the given weeks
         """
         if not window_weeks:
             raise ValueError("Cannot create window aggregate from empty weeks")
@@ -175,32 +434,10 @@ class RollingWindowAggregator:
         # Window boundaries
         window_start = window_weeks[0].week_start
 
-        # Calculate window_end as end of last week (Sunday 23:59:59)
-        last_week_start = window_weeks[-1].week_start
-        # Add 6 days to get to Sunday, then set time to end of day
-        window_end = datetime(
-            last_week_start.year,
-            last_week_start.month,
-            last_week_start.day,
-            23, 59, 59,
-            tzinfo=timezone.utc
-        ) + timedelta(days=6)
-
-        # Sum numeric metrics from weekly aggregates
-        total_commits = sum(week.total_commits for week in window_weeks)
-        total_lines_added = sum(week.total_lines_added for week in window_weeks)
-        total_lines_deleted = sum(week.total_lines_deleted for week in window_weeks)
-
-        # Deduplicate authors across window
-        unique_authors_set = set(commit.author_name for commit in window_commits)
-        unique_authors = len(unique_authors_set)
-
-        # Deduplicate versions across window
-        versions_set = set()
-        for commit in window_commits:
-            if commit.version is not None:
-                versions_set.add(commit.version)
-        versions_released = sorted(list(versions_set))
+        # Calculate window_end as end of last week (Sunday 23:59:59).
+        # week_start is always Monday midnight, so one shared offset
+        # replaces the per-window datetime reconstruction.
+        window_end = window_weeks[-1].week_start + _WEEK_END_OFFSET
 
         return RollingWindowAggregate(
             window_start=window_start,
@@ -3,7 +3,9 @@
 
 import argparse
 import logging
-from datetime import datetime
+import queue
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
 import sys
 
@@ -11,7 +13,7 @@ from .repository import GitRepository, WordPressRepository
 from .version_mapper import VersionMapper
 from .extractor import CommitExtractor
 from .aggregator import WeeklyAggregator, RollingWindowAggregator
-from .csv_writer import CSVWriter
+from .csv_writer import CSVWriter, YearlyCommitWriter
 
 
 def setup_logging():
@@ -38,11 +40,10 @@ def parse_date(date_str: str) -> datetime:
         ValueError: If date string is invalid
     """
     try:
-        # Parse as naive datetime
-        dt = datetime.strptime(date_str, '%Y-%m-%d')
-        # Add UTC timezone
-        return dt.replace(hour=0, minute=0, second=0, microsecond=0,
-                         tzinfo=datetime.now().astimezone().tzinfo)
+        # fromisoformat parses the bare date as midnight; pin it to UTC
+        # (the week-start math and the rest of the pipeline are UTC-based)
+        # rather than the machine's local zone
+        return datetime.fromisoformat(date_str).replace(tzinfo=timezone.utc)
     except ValueError as e:
         raise ValueError(
             f"Invalid date format '{date_str}'. Expected YYYY-MM-DD."
@@ -150,6 +151,62 @@ Examples:
         metavar="URL"
     )
 
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=1,
+        help="Worker processes for commit traversal (default: 1)",
+        metavar="N"
+    )
+
+    parser.add_argument(
+        "--full-clone",
+        action="store_true",
+        help="Clone the full history instead of a shallow clone bounded by --since"
+    )
+
+    parser.add_argument(
+        "--output-format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="File format for per-commit output (default: csv; parquet needs pyarrow)"
+    )
+
+    parser.add_argument(
+        "--no-merges",
+        action="store_true",
+        help="Skip merge commits during traversal"
+    )
+
+    parser.add_argument(
+        "--use-pydriller",
+        action="store_true",
+        help="Traverse commits with PyDriller instead of the git-log fast path"
+    )
+
+    parser.add_argument(
+        "--no-fetch",
+        action="store_true",
+        help="Never update an existing cached repository"
+    )
+
+    parser.add_argument(
+        "--branch",
+        type=str,
+        default=None,
+        help="Only traverse commits reachable from this branch",
+        metavar="NAME"
+    )
+
+    parser.add_argument(
+        "--file-types",
+        type=str,
+        nargs="+",
+        default=None,
+        help="Only count commits touching these file extensions (e.g. .py .php)",
+        metavar="EXT"
+    )
+
     args = parser.parse_args()
 
     try:
@@ -168,6 +225,10 @@ Examples:
         args.cache_dir.mkdir(parents=True, exist_ok=True)
         args.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Shallow-clone from the analysis start date unless a full clone
+        # is explicitly requested
+        shallow_since = None if args.full_clone else start_date
+
         # Initialize repository
         if args.repo_url:
             # Custom repository URL provided
@@ -175,17 +236,22 @@ Examples:
                 args.repo_name = infer_repo_name_from_url(args.repo_url)
 
             logger.info(f"Initializing repository from {args.repo_url}...")
-            repo = GitRepository(args.repo_url, args.cache_dir, args.repo_name)
+            repo = GitRepository(args.repo_url, args.cache_dir, args.repo_name,
+                                 num_workers=args.num_workers,
+                                 shallow_since=shallow_since)
         else:
             # Default to WordPress for backward compatibility
             if not args.repo_name:
                 args.repo_name = "WordPress"
 
             logger.info("Initializing WordPress repository...")
-            repo = WordPressRepository(args.cache_dir)
+            repo = WordPressRepository(args.cache_dir,
+                                       num_workers=args.num_workers,
+                                       shallow_since=shallow_since)
 
         logger.info("Ensuring repository is cloned...")
-        repo_path = repo.ensure_cloned()
+        repo_path = repo.ensure_cloned(end_date=end_date,
+                                       no_fetch=args.no_fetch)
         logger.info(f"Repository ready at: {repo_path}")
 
         # Initialize components
@@ -195,19 +261,76 @@ Examples:
         extractor = CommitExtractor(version_mapper)
         aggregator = WeeklyAggregator()
 
-        # Traverse commits
+        # Traverse commits, feeding the weekly aggregator and the per-year
+        # commit writer as each commit is extracted. Nothing retains the
+        # CommitData objects, so peak memory stays at weekly-summary scale
+        # instead of growing with the commit count.
         logger.info(f"Traversing commits from {args.since} to {args.to}...")
-        commits = []
+        year_writer = YearlyCommitWriter(args.output_dir, args.repo_name,
+                                         file_format=args.output_format)
         commit_count = 0
 
-        for pydriller_commit in repo.get_commits(since=start_date, to=end_date):
-            commit_data = extractor.extract(pydriller_commit)
-            commits.append(commit_data)
-            commit_count += 1
-
-            # Log progress every 1000 commits
-            if commit_count % 1000 == 0:
-                logger.info(f"Processed {commit_count} commits...")
+        # Per-commit writes happen on a separate thread fed by a bounded
+        # queue, so disk I/O overlaps the git/PyDriller work on the main
+        # thread instead of serializing with it
+        write_queue: queue.Queue = queue.Queue(maxsize=10_000)
+        writer_errors: list = []
+
+        def _drain_write_queue():
+            while True:
+                queued = write_queue.get()
+                if queued is None:
+                    break
+                if writer_errors:
+                    # Keep consuming after a failure so the producer
+                    # never blocks on a full queue
+                    continue
+                try:
+                    year_writer.add(queued)
+                except Exception as exc:
+                    writer_errors.append(exc)
+
+        writer_thread = threading.Thread(
+            target=_drain_write_queue, name="commit-writer"
+        )
+        writer_thread.start()
+
+        # The fast path parses `git log --numstat` directly; PyDriller is
+        # only needed when its richer filters (--file-types) are requested
+        # or explicitly asked for
+        if args.use_pydriller or args.file_types is not None:
+            commit_iter = repo.get_commits(
+                since=start_date,
+                to=end_date,
+                only_no_merges=args.no_merges,
+                only_in_branch=args.branch,
+                only_modifications_with_file_types=args.file_types,
+            )
+        else:
+            commit_iter = repo.get_commits_fast(
+                since=start_date,
+                to=end_date,
+                only_no_merges=args.no_merges,
+                only_in_branch=args.branch,
+            )
+
+        try:
+            for raw_commit in commit_iter:
+                commit_data = extractor.extract(raw_commit)
+                aggregator.update(commit_data)
+                write_queue.put(commit_data)
+                commit_count += 1
+
+                # Log progress every 1000 commits
+                if commit_count % 1000 == 0:
+                    logger.info(f"Processed {commit_count} commits...")
+        finally:
+            write_queue.put(None)
+            writer_thread.join()
+            year_writer.close()
+
+        if writer_errors:
+            raise writer_errors[0]
 
         logger.info(f"Total commits processed: {commit_count}")
 
@@ -217,22 +340,21 @@ Examples:
 
         # Aggregate commits
         logger.info("Aggregating commits by week...")
-        aggregates = aggregator.aggregate(commits)
+        aggregates = aggregator.finalize()
         logger.info(f"Created {len(aggregates)} weekly aggregates")
 
         # Create rolling window aggregates
         logger.info("Aggregating 12-week rolling windows...")
         rolling_aggregator = RollingWindowAggregator()
-        rolling_windows = rolling_aggregator.aggregate(commits, aggregates)
+        rolling_windows = rolling_aggregator.aggregate_weekly(
+            aggregates, aggregator.authors_by_week
+        )
         logger.info(f"Created {len(rolling_windows)} rolling window aggregates")
 
         # Write CSV files
         aggregates_path = args.output_dir / args.repo_name / "weekly_aggregates.csv"
         rolling_path = args.output_dir / args.repo_name / "rolling_window_aggregates.csv"
 
-        logger.info("Writing commits grouped by year...")
-        CSVWriter.write_commits_by_year(commits, args.output_dir, args.repo_name)
-
         logger.info(f"Writing combined weekly aggregates to {aggregates_path}...")
         CSVWriter.write_aggregates(aggregates, aggregates_path)
 
@@ -240,7 +362,7 @@ Examples:
         CSVWriter.write_rolling_aggregates(rolling_windows, rolling_path)
 
         logger.info("Analysis complete!")
-        logger.info(f"  Commits organized by year in: {args.output_dir}/{args.repo_name}/YYYY/commits.csv")
+        logger.info(f"  Commits organized by year in: {args.output_dir}/{args.repo_name}/YYYY/commits.{args.output_format}")
         logger.info(f"  Combined weekly aggregates: {aggregates_path}")
         logger.info(f"  12-week rolling window aggregates: {rolling_path}")
 
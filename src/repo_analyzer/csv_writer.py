@@ -2,12 +2,129 @@
 # ABOUTME: Handles UTF-8 encoding, ISO 8601 dates, and semicolon-separated version lists.
 
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict
 from collections import defaultdict
 
 from .models import CommitData, WeeklyAggregate, RollingWindowAggregate
 
+# Output buffer size; fewer, larger writes beat the default 8 KiB buffer
+# on commit files spanning hundreds of thousands of rows
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Directories already created this process: mkdir(parents=True,
+# exist_ok=True) costs several stat/mkdir syscalls even when the
+# directory exists, and the per-year writers hit the same parents
+# repeatedly
+_created_dirs: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process, skipping repeat syscalls."""
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+
+_COMMIT_HEADER = (
+    'hash',
+    'author_name',
+    'commit_date',
+    'lines_added',
+    'lines_deleted',
+    'version'
+)
+
+
+def _commit_row(commit: CommitData) -> tuple:
+    """Build the CSV row tuple for one commit."""
+    return (
+        commit.hash,
+        commit.author_name,
+        commit.commit_date.isoformat(),
+        commit.lines_added,
+        commit.lines_deleted,
+        commit.version or ''
+    )
+
+
+class YearlyCommitWriter:
+    """Incrementally writes commits into per-year files.
+
+    Streaming counterpart to CSVWriter.write_commits_by_year: feed
+    commits one at a time with add() as a pipeline produces them, then
+    close(). CSV rows go straight to the per-year file handles; Parquet
+    output buffers per year because Arrow tables are built whole.
+    """
+
+    def __init__(self, base_output_dir: Path, repo_name: str,
+                 file_format: str = 'csv'):
+        """Initialize the writer.
+
+        Args:
+            base_output_dir: Base directory (e.g., 'data/')
+            repo_name: Repository name for output organization
+            file_format: 'csv' (default) or 'parquet'
+        """
+        self.base_output_dir = base_output_dir
+        self.repo_name = repo_name
+        self.file_format = file_format
+        self._open_files: Dict[int, object] = {}
+        self._writers: Dict[int, object] = {}
+        self._parquet_buffers: Dict[int, List[CommitData]] = defaultdict(list)
+
+    def add(self, commit: CommitData) -> None:
+        """Write (or buffer) one commit under its year.
+
+        Args:
+            commit: CommitData object to write
+        """
+        year = commit.commit_date.year
+
+        if self.file_format == 'parquet':
+            self._parquet_buffers[year].append(commit)
+            return
+
+        writer = self._writers.get(year)
+        if writer is None:
+            year_dir = self._year_dir(year)
+            f = open(year_dir / "commits.csv", 'w', encoding='utf-8',
+                     newline='', buffering=_WRITE_BUFFER_SIZE)
+            self._open_files[year] = f
+            writer = self._writers[year] = csv.writer(f)
+            writer.writerow(_COMMIT_HEADER)
+
+        writer.writerow(_commit_row(commit))
+
+    def close(self) -> None:
+        """Flush buffered output and close all per-year files."""
+        if self._parquet_buffers:
+            # Per-year Parquet files are independent, and pyarrow releases
+            # the GIL while encoding/compressing, so fan the writes out
+            # across threads
+            tasks = [
+                (year_commits, self._year_dir(year) / "commits.parquet")
+                for year, year_commits in self._parquet_buffers.items()
+            ]
+            workers = min(8, len(tasks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # list() re-raises the first write failure
+                list(executor.map(
+                    lambda task: CSVWriter.write_commits_parquet(*task), tasks
+                ))
+            self._parquet_buffers.clear()
+
+        for f in self._open_files.values():
+            f.close()
+        self._open_files.clear()
+        self._writers.clear()
+
+    def _year_dir(self, year: int) -> Path:
+        """Create and return the output directory for a year."""
+        year_dir = self.base_output_dir / self.repo_name / str(year)
+        _ensure_dir(year_dir)
+        return year_dir
+
 
 class CSVWriter:
     """Writes analysis results to CSV files."""
@@ -21,30 +138,15 @@ class CSVWriter:
             output_path: Path to output CSV file
         """
         # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            fieldnames = [
-                'hash',
-                'author_name',
-                'commit_date',
-                'lines_added',
-                'lines_deleted',
-                'version'
-            ]
+        _ensure_dir(output_path.parent)
 
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for commit in commits:
-                writer.writerow({
-                    'hash': commit.hash,
-                    'author_name': commit.author_name,
-                    'commit_date': commit.commit_date.isoformat(),
-                    'lines_added': commit.lines_added,
-                    'lines_deleted': commit.lines_deleted,
-                    'version': commit.version if commit.version is not None else ''
-                })
+        # Plain csv.writer over tuples skips DictWriter's per-row fieldname
+        # lookups, and the large buffer batches many rows per syscall
+        with open(output_path, 'w', encoding='utf-8', newline='',
+                  buffering=_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(_COMMIT_HEADER)
+            writer.writerows(_commit_row(commit) for commit in commits)
 
     @staticmethod
     def write_aggregates(aggregates: List[WeeklyAggregate],
@@ -56,65 +158,102 @@ class CSVWriter:
             output_path: Path to output CSV file
         """
         # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_path.parent)
 
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            fieldnames = [
+        with open(output_path, 'w', encoding='utf-8', newline='',
+                  buffering=_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow((
                 'week_start',
                 'total_commits',
                 'unique_authors',
                 'total_lines_added',
                 'total_lines_deleted',
                 'versions_released'
-            ]
+            ))
+            writer.writerows(
+                (
+                    aggregate.week_start.isoformat(),
+                    aggregate.total_commits,
+                    aggregate.unique_authors,
+                    aggregate.total_lines_added,
+                    aggregate.total_lines_deleted,
+                    # Join versions list with semicolon separator
+                    ';'.join(aggregate.versions_released)
+                )
+                for aggregate in aggregates
+            )
+
+    @staticmethod
+    def write_commits_parquet(commits: List[CommitData], output_path: Path) -> None:
+        """Write per-commit data to a Parquet file.
+
+        Columnar storage with zstd compression is much smaller and faster
+        to read back than CSV for analytical consumers. Requires pyarrow.
 
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+        Args:
+            commits: List of CommitData objects to write
+            output_path: Path to output Parquet file
+
+        Raises:
+            RuntimeError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet output requires pyarrow. Install it with: "
+                "pip install pyarrow"
+            ) from e
 
-            for aggregate in aggregates:
-                # Join versions list with semicolon separator
-                versions_str = ';'.join(aggregate.versions_released)
+        # Ensure parent directory exists
+        _ensure_dir(output_path.parent)
 
-                writer.writerow({
-                    'week_start': aggregate.week_start.isoformat(),
-                    'total_commits': aggregate.total_commits,
-                    'unique_authors': aggregate.unique_authors,
-                    'total_lines_added': aggregate.total_lines_added,
-                    'total_lines_deleted': aggregate.total_lines_deleted,
-                    'versions_released': versions_str
-                })
+        table = pa.table({
+            'hash': [c.hash for c in commits],
+            'author_name': pa.array(
+                [c.author_name for c in commits]
+            ).dictionary_encode(),
+            'commit_date': pa.array(
+                [c.commit_date for c in commits],
+                type=pa.timestamp('us', tz='UTC')
+            ),
+            'lines_added': pa.array(
+                [c.lines_added for c in commits], type=pa.int32()
+            ),
+            'lines_deleted': pa.array(
+                [c.lines_deleted for c in commits], type=pa.int32()
+            ),
+            # version stays a plain string column: Parquet can't write
+            # dictionary arrays whose values include nulls
+            'version': pa.array([c.version for c in commits], type=pa.string()),
+        })
+        pq.write_table(table, output_path, compression='zstd')
 
     @staticmethod
-    def write_commits_by_year(commits: List[CommitData], base_output_dir: Path, repo_name: str) -> None:
+    def write_commits_by_year(commits: List[CommitData], base_output_dir: Path,
+                              repo_name: str, file_format: str = 'csv') -> None:
         """Write commits grouped by year into separate folders.
 
         Args:
             commits: List of all CommitData objects
             base_output_dir: Base directory (e.g., 'data/')
             repo_name: Repository name for output organization (e.g., 'WordPress')
+            file_format: 'csv' (default) or 'parquet'
 
         Creates structure:
-            base_output_dir/repo_name/YYYY/commits.csv
+            base_output_dir/repo_name/YYYY/commits.csv (or .parquet)
         """
         if not commits:
             return
 
-        # Group commits by year
-        yearly_commits: Dict[int, List[CommitData]] = defaultdict(list)
-
-        for commit in commits:
-            year = commit.commit_date.year
-            yearly_commits[year].append(commit)
-
-        # Write each year's commits to its own file
-        for year, year_commits in yearly_commits.items():
-            # Create directory path: base_output_dir/repo_name/YYYY/
-            year_dir = base_output_dir / repo_name / str(year)
-            year_dir.mkdir(parents=True, exist_ok=True)
-
-            # Write commits.csv for this year
-            commits_path = year_dir / "commits.csv"
-            CSVWriter.write_commits(year_commits, commits_path)
+        writer = YearlyCommitWriter(base_output_dir, repo_name, file_format)
+        try:
+            for commit in commits:
+                writer.add(commit)
+        finally:
+            writer.close()
 
     @staticmethod
     def write_rolling_aggregates(
@@ -128,10 +267,12 @@ class CSVWriter:
             output_path: Path to output CSV file
         """
         # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_path.parent)
 
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            fieldnames = [
+        with open(output_path, 'w', encoding='utf-8', newline='',
+                  buffering=_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow((
                 'window_start',
                 'window_end',
                 'total_commits',
@@ -139,21 +280,17 @@ class CSVWriter:
                 'total_lines_added',
                 'total_lines_deleted',
                 'versions_released'
-            ]
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for aggregate in rolling_aggregates:
-                # Join versions list with semicolon separator
-                versions_str = ';'.join(aggregate.versions_released)
-
-                writer.writerow({
-                    'window_start': aggregate.window_start.isoformat(),
-                    'window_end': aggregate.window_end.isoformat(),
-                    'total_commits': aggregate.total_commits,
-                    'unique_authors': aggregate.unique_authors,
-                    'total_lines_added': aggregate.total_lines_added,
-                    'total_lines_deleted': aggregate.total_lines_deleted,
-                    'versions_released': versions_str
-                })
+            ))
+            writer.writerows(
+                (
+                    aggregate.window_start.isoformat(),
+                    aggregate.window_end.isoformat(),
+                    aggregate.total_commits,
+                    aggregate.unique_authors,
+                    aggregate.total_lines_added,
+                    aggregate.total_lines_deleted,
+                    # Join versions list with semicolon separator
+                    ';'.join(aggregate.versions_released)
+                )
+                for aggregate in rolling_aggregates
+            )
@@ -1,6 +1,8 @@
 # ABOUTME: Extracts structured metadata from PyDriller commit objects.
 # ABOUTME: Converts PyDriller commits to CommitData model with version enrichment.
 
+from sys import intern
+
 from pydriller.domain.commit import Commit as PyDrillerCommit
 
 from .models import CommitData
@@ -17,6 +19,9 @@ class CommitExtractor:
             version_mapper: VersionMapper instance for looking up commit versions
         """
         self.version_mapper = version_mapper
+        # Bind the lookup once: the hot loop then pays one call instead of
+        # two attribute fetches plus a call per commit
+        self._get_version = version_mapper.get_version_for_commit
 
     def extract(self, commit: PyDrillerCommit) -> CommitData:
         """Convert PyDriller commit to CommitData model.
@@ -27,11 +32,17 @@ class CommitExtractor:
         Returns:
             CommitData object with metadata extracted from commit
         """
+        # Intern the author name: repos repeat a small set of authors across
+        # many commits, so duplicates share one string object whose hash is
+        # computed once, making the aggregators' set/dict lookups cheaper.
+        # Positional construction skips the keyword-matching step in the
+        # dataclass __init__ on this per-commit path.
+        commit_hash = commit.hash
         return CommitData(
-            hash=commit.hash,
-            author_name=commit.author.name,
-            commit_date=commit.author_date,
-            lines_added=commit.insertions,
-            lines_deleted=commit.deletions,
-            version=self.version_mapper.get_version_for_commit(commit.hash)
+            commit_hash,
+            intern(commit.author.name),
+            commit.author_date,
+            commit.insertions,
+            commit.deletions,
+            self._get_version(commit_hash)
         )
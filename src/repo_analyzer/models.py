@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommitData:
     """Represents metadata extracted from a single git commit."""
     hash: str
@@ -17,7 +17,7 @@ class CommitData:
     version: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeeklyAggregate:
     """Represents aggregated commit statistics for one week."""
     week_start: datetime
@@ -28,7 +28,7 @@ class WeeklyAggregate:
     versions_released: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RollingWindowAggregate:
     """Represents aggregated statistics for a 12-week rolling window."""
     window_start: datetime
@@ -3,8 +3,10 @@
 
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from itertools import accumulate
 from typing import Dict, List
 
+from repo_analyzer.aggregator import _week_start_for_day
 from repo_analyzer.svn.models import (
     ContributorStats,
     SVNCommitData,
@@ -22,26 +24,24 @@ def get_iso_week_start(date: datetime) -> datetime:
     Returns:
         Datetime representing Monday at 00:00:00 UTC of the ISO week.
     """
-    iso_year, iso_week, iso_weekday = date.isocalendar()
+    # Delegate to the git pipeline's per-day memoized helper: both
+    # aggregators hit the same handful of calendar days over and over,
+    # so repeat lookups share one cache and skip the datetime math.
+    return _week_start_for_day(date.year, date.month, date.day)
 
-    # Calculate the Monday of this ISO week
-    days_from_monday = iso_weekday - 1
-    monday = date - timedelta(days=days_from_monday)
 
-    # Set to midnight UTC
-    week_start = datetime(
-        monday.year,
-        monday.month,
-        monday.day,
-        0, 0, 0,
-        tzinfo=timezone.utc
-    )
-
-    return week_start
+class SVNWeeklyAggregator:
+    """Aggregates SVN commit data into weekly summaries with props tracking.
 
+    After aggregate() runs, authors_by_week and props_by_week hold the
+    per-week contributor sets, so downstream consumers (the rolling
+    window aggregator, the unique-props count) don't re-traverse the
+    commits.
+    """
 
-class SVNWeeklyAggregator:
-    """Aggregates SVN commit data into weekly summaries with props tracking."""
+    def __init__(self):
+        self.authors_by_week: Dict[datetime, set] = {}
+        self.props_by_week: Dict[datetime, set] = {}
 
     def aggregate(self, commits: List[SVNCommitData]) -> List[SVNWeeklyAggregate]:
         """Group commits by ISO week and compute aggregates.
@@ -52,6 +52,9 @@ class SVNWeeklyAggregator:
         Returns:
             List of SVNWeeklyAggregate objects sorted by week_start.
         """
+        self.authors_by_week = {}
+        self.props_by_week = {}
+
         if not commits:
             return []
 
@@ -82,6 +85,8 @@ class SVNWeeklyAggregator:
         # Create SVNWeeklyAggregate objects
         aggregates = []
         for week_start, data in weeks_data.items():
+            self.authors_by_week[week_start] = data["authors"]
+            self.props_by_week[week_start] = data["props_contributors"]
             aggregate = SVNWeeklyAggregate(
                 week_start=week_start,
                 total_commits=len(data["commits"]),
@@ -134,19 +139,113 @@ class SVNRollingWindowAggregator:
         # Group commits by week_start for deduplication
         commits_by_week = self._group_commits_by_week(commits)
 
-        rolling_windows = []
+        # Reduce the grouped commits to per-week author and props sets;
+        # that is all the window dedup needs
+        authors_by_week = {}
+        props_by_week = {}
+        for week_start, week_commits in commits_by_week.items():
+            authors = set()
+            props = set()
+            for commit in week_commits:
+                authors.add(commit.author)
+                props.update(commit.props)
+            authors_by_week[week_start] = authors
+            props_by_week[week_start] = props
+
+        return self.aggregate_weekly(
+            weekly_aggregates, authors_by_week, props_by_week
+        )
 
-        for i, week_agg in enumerate(weekly_aggregates):
-            # Get next 12 weeks (or fewer at end)
-            window_weeks = weekly_aggregates[i:i + self.WINDOW_SIZE_WEEKS]
+    def aggregate_weekly(
+        self,
+        weekly_aggregates: List[SVNWeeklyAggregate],
+        authors_by_week: Dict[datetime, set],
+        props_by_week: Dict[datetime, set],
+    ) -> List[SVNRollingWindowAggregate]:
+        """Compute 12-week rolling windows from weekly data alone.
 
-            # Collect all commits in window for deduplication
-            window_commits = []
-            for week in window_weeks:
-                window_commits.extend(commits_by_week.get(week.week_start, []))
+        Works without the raw commits: numeric metrics come from the
+        weekly aggregates and deduplication from the per-week sets the
+        weekly aggregator already built, so the commit list is not
+        traversed again.
 
-            # Create rolling window aggregate
-            rolling_window = self._create_window_aggregate(window_weeks, window_commits)
+        Args:
+            weekly_aggregates: List of SVNWeeklyAggregate objects sorted by week_start.
+            authors_by_week: Mapping of week_start to that week's author set.
+            props_by_week: Mapping of week_start to that week's props contributor set.
+
+        Returns:
+            List of SVNRollingWindowAggregate objects, one per week.
+        """
+        if not weekly_aggregates:
+            return []
+
+        n = len(weekly_aggregates)
+        week_authors = [
+            authors_by_week.get(week.week_start, ())
+            for week in weekly_aggregates
+        ]
+        week_props = [
+            props_by_week.get(week.week_start, ())
+            for week in weekly_aggregates
+        ]
+
+        # Prefix sums over the weekly metrics: each window sum becomes one
+        # subtraction instead of re-summing up to 12 weeks per window.
+        cum_commits = [0, *accumulate(w.total_commits for w in weekly_aggregates)]
+        cum_added = [0, *accumulate(w.total_lines_added for w in weekly_aggregates)]
+        cum_deleted = [0, *accumulate(w.total_lines_deleted for w in weekly_aggregates)]
+
+        # Sliding multiset of the weeks currently in the window: each
+        # author/props contributor is counted in as its week enters and
+        # counted out as it expires, so every week is processed twice in
+        # total instead of once per window it overlaps. Entries are
+        # deleted when their count reaches zero, so len() is the live
+        # unique count.
+        author_counts: dict = {}
+        props_counts: dict = {}
+
+        def _add_week(index: int) -> None:
+            for author in week_authors[index]:
+                author_counts[author] = author_counts.get(author, 0) + 1
+            for prop in week_props[index]:
+                props_counts[prop] = props_counts.get(prop, 0) + 1
+
+        def _remove_week(index: int) -> None:
+            for author in week_authors[index]:
+                remaining = author_counts[author] - 1
+                if remaining:
+                    author_counts[author] = remaining
+                else:
+                    del author_counts[author]
+            for prop in week_props[index]:
+                remaining = props_counts[prop] - 1
+                if remaining:
+                    props_counts[prop] = remaining
+                else:
+                    del props_counts[prop]
+
+        rolling_windows = []
+        covered = 0  # leading weeks currently folded into the counters
+        window_size = self.WINDOW_SIZE_WEEKS
+
+        for i in range(n):
+            # Window covers the next 12 weeks (or fewer at end)
+            end = min(i + window_size, n)
+            if i > 0:
+                _remove_week(i - 1)
+            while covered < end:
+                _add_week(covered)
+                covered += 1
+
+            rolling_window = self._create_window_aggregate(
+                weekly_aggregates[i:end],
+                total_commits=cum_commits[end] - cum_commits[i],
+                total_lines_added=cum_added[end] - cum_added[i],
+                total_lines_deleted=cum_deleted[end] - cum_deleted[i],
+                unique_authors=len(author_counts),
+                unique_props_contributors=len(props_counts),
+            )
             rolling_windows.append(rolling_window)
 
         return rolling_windows
@@ -166,9 +265,13 @@ class SVNRollingWindowAggregator:
     def _create_window_aggregate(
         self,
         window_weeks: List[SVNWeeklyAggregate],
-        window_commits: List[SVNCommitData],
+        total_commits: int,
+        total_lines_added: int,
+        total_lines_deleted: int,
+        unique_authors: int,
+        unique_props_contributors: int,
     ) -> SVNRollingWindowAggregate:
-        """Create a SVNRollingWindowAggregate from weeks and commits."""
+        """Create a SVNRollingWindowAggregate from precomputed window stats."""
         if not window_weeks:
             raise ValueError("Cannot create window aggregate from empty weeks")
 
@@ -186,24 +289,6 @@ class SVNRollingWindowAggregator:
             tzinfo=timezone.utc
         ) + timedelta(days=6)  # Monday + 6 days = Sunday
 
-        # Sum commits from weekly aggregates
-        total_commits = sum(week.total_commits for week in window_weeks)
-
-        # Sum line changes from weekly aggregates
-        total_lines_added = sum(week.total_lines_added for week in window_weeks)
-        total_lines_deleted = sum(week.total_lines_deleted for week in window_weeks)
-
-        # Deduplicate authors across window
-        unique_authors_set = set(commit.author for commit in window_commits)
-        unique_authors = len(unique_authors_set)
-
-        # Deduplicate props contributors across window
-        props_set = set()
-        for commit in window_commits:
-            for prop in commit.props:
-                props_set.add(prop)
-        unique_props_contributors = len(props_set)
-
         return SVNRollingWindowAggregate(
             window_start=window_start,
             window_end=window_end,
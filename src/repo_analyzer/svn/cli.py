@@ -4,21 +4,19 @@
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import date, datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from repo_analyzer.svn.aggregator import (
-    ContributorTracker,
-    SVNRollingWindowAggregator,
-    SVNWeeklyAggregator,
-)
-from repo_analyzer.svn.csv_writer import SVNCSVWriter
-from repo_analyzer.svn.diff_cache import SVNDiffCache
-from repo_analyzer.svn.diff_fetcher import SVNDiffFetcher
-from repo_analyzer.svn.extractor import SVNExtractor
-from repo_analyzer.svn.models import SVNCommitData
-from repo_analyzer.svn.repository import SVNRepository, WordPressSVNRepository
+if TYPE_CHECKING:
+    from repo_analyzer.svn.models import SVNCommitData
+    from repo_analyzer.svn.repository import SVNRepository
+
+# The pipeline modules are imported inside main() so that --help and
+# argument errors don't pay their import cost
 
 
 def setup_logging() -> None:
@@ -145,13 +143,13 @@ Examples:
 
 
 def _fetch_and_enrich_commits(
-    commits: List[SVNCommitData],
-    repo: SVNRepository,
+    commits: List["SVNCommitData"],
+    repo: "SVNRepository",
     cache_dir: Path,
     batch_size: int,
     workers: int,
     logger: logging.Logger,
-) -> List[SVNCommitData]:
+) -> List["SVNCommitData"]:
     """Fetch diffs and enrich commits with line change statistics.
 
     Args:
@@ -165,6 +163,9 @@ def _fetch_and_enrich_commits(
     Returns:
         List of enriched SVNCommitData with line stats populated.
     """
+    from repo_analyzer.svn.diff_cache import SVNDiffCache
+    from repo_analyzer.svn.diff_fetcher import SVNDiffFetcher
+
     # Initialize cache
     cache = SVNDiffCache(cache_dir, repo.url)
     cache.load()
@@ -173,52 +174,51 @@ def _fetch_and_enrich_commits(
     # Initialize fetcher
     fetcher = SVNDiffFetcher(repo, cache)
 
-    # Get all revision numbers
-    revisions = [c.revision for c in commits]
-    uncached = cache.get_uncached_revisions(revisions)
+    logger.info(f"Total revisions: {len(commits)}")
 
-    logger.info(f"Total revisions: {len(revisions)}, uncached: {len(uncached)}")
+    def on_progress(completed: int, total: int) -> None:
+        pct = (completed / total * 100) if total > 0 else 100
+        logger.info(f"Fetching diffs: {completed}/{total} ({pct:.1f}%)")
 
-    # Fetch uncached diffs in batches
-    if uncached:
-        total_batches = (len(uncached) + batch_size - 1) // batch_size
+    # Stream uncached revisions straight into fixed-size fetch batches
+    # instead of materializing the full revision and uncached lists
+    uncached_iter = cache.iter_uncached(c.revision for c in commits)
+    batch_idx = 0
 
-        def on_progress(completed: int, total: int) -> None:
-            pct = (completed / total * 100) if total > 0 else 100
-            logger.info(f"Fetching diffs: {completed}/{total} ({pct:.1f}%)")
+    while batch_revisions := list(islice(uncached_iter, batch_size)):
+        batch_idx += 1
+        logger.info(
+            f"Batch {batch_idx}: "
+            f"revisions {batch_revisions[0]}-{batch_revisions[-1]}"
+        )
 
-        for batch_idx in range(total_batches):
-            batch_start = batch_idx * batch_size
-            batch_end = min(batch_start + batch_size, len(uncached))
-            batch_revisions = uncached[batch_start:batch_end]
+        fetcher.fetch_diffs_batch(
+            batch_revisions,
+            workers=workers,
+            save_cache=False,
+            on_progress=on_progress,
+        )
 
-            logger.info(
-                f"Batch {batch_idx + 1}/{total_batches}: "
-                f"revisions {batch_revisions[0]}-{batch_revisions[-1]}"
-            )
+        # Journal just this batch's entries instead of rewriting the
+        # whole cache file after every batch
+        cache.append_pending()
 
-            fetcher.fetch_diffs_batch(
-                batch_revisions,
-                workers=workers,
-                save_cache=True,
-                on_progress=on_progress,
-            )
+    if batch_idx:
+        # Fold the journal back into the base file
+        cache.save()
 
-    # Enrich commits with line stats
+    # Enrich commits with line stats. dataclasses.replace copies only
+    # the two changed fields explicitly and keeps SVNCommitData frozen;
+    # commits without a cache entry are passed through untouched.
     enriched_commits = []
     for commit in commits:
         entry = cache.get(commit.revision)
         if entry is not None:
-            enriched = SVNCommitData(
-                revision=commit.revision,
-                author=commit.author,
-                commit_date=commit.commit_date,
-                message=commit.message,
-                props=commit.props,
+            enriched_commits.append(replace(
+                commit,
                 lines_added=entry.lines_added,
                 lines_deleted=entry.lines_deleted,
-            )
-            enriched_commits.append(enriched)
+            ))
         else:
             enriched_commits.append(commit)
 
@@ -236,6 +236,18 @@ def main() -> None:
 
     args = parse_args()
 
+    from repo_analyzer.svn.aggregator import (
+        ContributorTracker,
+        SVNRollingWindowAggregator,
+        SVNWeeklyAggregator,
+    )
+    from repo_analyzer.svn.csv_writer import SVNCSVWriter
+    from repo_analyzer.svn.extractor import SVNExtractor
+    from repo_analyzer.svn.repository import (
+        SVNRepository,
+        WordPressSVNRepository,
+    )
+
     try:
         # Parse dates
         logger.info("Parsing date range...")
@@ -297,10 +309,15 @@ def main() -> None:
         weekly_aggregates = weekly_aggregator.aggregate(commits)
         logger.info(f"Created {len(weekly_aggregates)} weekly aggregates")
 
-        # Create rolling window aggregates
+        # Create rolling window aggregates from the weekly pass's
+        # per-week sets, without traversing the commits again
         logger.info("Creating 12-week rolling window aggregates...")
         rolling_aggregator = SVNRollingWindowAggregator()
-        rolling_windows = rolling_aggregator.aggregate(commits, weekly_aggregates)
+        rolling_windows = rolling_aggregator.aggregate_weekly(
+            weekly_aggregates,
+            weekly_aggregator.authors_by_week,
+            weekly_aggregator.props_by_week,
+        )
         logger.info(f"Created {len(rolling_windows)} rolling window aggregates")
 
         # Track contributor lifetimes
@@ -313,43 +330,48 @@ def main() -> None:
         contributor_stats = contributor_tracker.track(commits, cutoff)
         logger.info(f"Tracked {len(contributor_stats)} unique Props contributors")
 
-        # Count unique Props across all commits
-        all_props = set()
-        for commit in commits:
-            all_props.update(commit.props)
+        # Count unique Props from the weekly pass's per-week sets
+        all_props = set().union(*weekly_aggregator.props_by_week.values()) \
+            if weekly_aggregator.props_by_week else set()
         logger.info(f"Unique Props contributors total: {len(all_props)}")
 
         # Write CSV files
         svn_output_dir = args.output_dir / "svn"
         svn_output_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info("Writing commits grouped by year...")
-        SVNCSVWriter.write_commits_by_year(commits, args.output_dir, "svn")
-
         weekly_path = svn_output_dir / "weekly_aggregates.csv"
-        logger.info(f"Writing weekly aggregates to {weekly_path}...")
-        SVNCSVWriter.write_weekly_aggregates(weekly_aggregates, weekly_path)
-
         rolling_path = svn_output_dir / "rolling_window_aggregates.csv"
-        logger.info(f"Writing rolling window aggregates to {rolling_path}...")
-        SVNCSVWriter.write_rolling_aggregates(rolling_windows, rolling_path)
-
         contributors_path = svn_output_dir / "contributor_lifetimes.csv"
-        logger.info(f"Writing contributor lifetimes to {contributors_path}...")
-        SVNCSVWriter.write_contributor_stats(contributor_stats, contributors_path)
 
-        # Write notebook-friendly CSV files (simpler date format, year/week columns)
-        # These are written to src/notebooks/data/ for use by Marimo notebooks
+        # Notebook-friendly CSV files (simpler date format, year/week
+        # columns) go to src/notebooks/data/ for use by Marimo notebooks
         notebook_data_dir = Path(__file__).parent.parent.parent / "notebooks" / "data"
         notebook_data_dir.mkdir(parents=True, exist_ok=True)
 
         weekly_notebook_path = notebook_data_dir / "weekly_stats.csv"
-        logger.info(f"Writing notebook-friendly weekly stats to {weekly_notebook_path}...")
-        SVNCSVWriter.write_weekly_aggregates_marimo(weekly_aggregates, weekly_notebook_path)
-
         rolling_notebook_path = notebook_data_dir / "rolling_12week_stats.csv"
-        logger.info(f"Writing notebook-friendly rolling window stats to {rolling_notebook_path}...")
-        SVNCSVWriter.write_rolling_aggregates_marimo(rolling_windows, rolling_notebook_path)
+
+        # The six outputs are independent datasets going to separate
+        # files, so overlap their disk writes on a small thread pool
+        # instead of serializing them
+        logger.info("Writing output files...")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(SVNCSVWriter.write_commits_by_year,
+                                commits, args.output_dir, "svn"),
+                executor.submit(SVNCSVWriter.write_weekly_aggregates,
+                                weekly_aggregates, weekly_path),
+                executor.submit(SVNCSVWriter.write_rolling_aggregates,
+                                rolling_windows, rolling_path),
+                executor.submit(SVNCSVWriter.write_contributor_stats,
+                                contributor_stats, contributors_path),
+                executor.submit(SVNCSVWriter.write_weekly_aggregates_marimo,
+                                weekly_aggregates, weekly_notebook_path),
+                executor.submit(SVNCSVWriter.write_rolling_aggregates_marimo,
+                                rolling_windows, rolling_notebook_path),
+            ]
+            for future in futures:
+                future.result()
 
         logger.info("Analysis complete!")
         logger.info(f"  Commits by year: {args.output_dir}/svn/YYYY/commits.csv")
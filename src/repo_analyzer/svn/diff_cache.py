@@ -3,13 +3,28 @@
 
 import hashlib
 import json
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    # orjson serializes/parses in C, 5-10x faster than stdlib json on
+    # large caches; fall back silently when it isn't installed
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass(frozen=True)
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix."""
+    # strftime emits the Z directly, skipping isoformat's +00:00 suffix
+    # plus the str.replace that used to rewrite it
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass(frozen=True, slots=True)
 class DiffCacheEntry:
     """Represents cached diff statistics for a single SVN revision.
 
@@ -66,17 +81,28 @@ class SVNDiffCache:
         self._repo_url = repo_url.rstrip("/")
         self._repo_hash = self._hash_url(self._repo_url)
         self._entries: Dict[int, DiffCacheEntry] = {}
+        # Entries put since the last persist, for append-only journaling
+        self._pending: List[DiffCacheEntry] = []
 
     def _hash_url(self, url: str) -> str:
-        """Create consistent hash from repository URL."""
+        """Create consistent hash from repository URL.
+
+        blake2b instead of md5: same 12 hex chars, but it is the faster
+        hash in CPython and sidesteps FIPS policies that disable md5.
+        """
         normalized = url.lower().rstrip("/")
-        return hashlib.md5(normalized.encode()).hexdigest()[:12]
+        return hashlib.blake2b(normalized.encode(), digest_size=6).hexdigest()
 
     @property
     def cache_path(self) -> Path:
         """Path to the cache JSON file."""
         return self._cache_dir / "svn" / f"{self._repo_hash}.json"
 
+    @property
+    def journal_path(self) -> Path:
+        """Path to the append-only journal of not-yet-compacted entries."""
+        return self._cache_dir / "svn" / f"{self._repo_hash}.jsonl"
+
     @property
     def size(self) -> int:
         """Number of entries in the cache."""
@@ -105,9 +131,31 @@ class SVNDiffCache:
             revision=revision,
             lines_added=lines_added,
             lines_deleted=lines_deleted,
-            fetched_at=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            fetched_at=_utc_timestamp(),
         )
         self._entries[revision] = entry
+        self._pending.append(entry)
+
+    def put_many(self, results) -> None:
+        """Store diff stats for many revisions with one shared timestamp.
+
+        A fetch batch completes within moments, so reading the clock and
+        formatting the timestamp once per batch instead of once per
+        revision is semantically equivalent and keeps the loop tight.
+
+        Args:
+            results: Iterable of (revision, lines_added, lines_deleted)
+                tuples.
+        """
+        fetched_at = _utc_timestamp()
+        entries = self._entries
+        pending = self._pending
+
+        for revision, lines_added, lines_deleted in results:
+            entry = DiffCacheEntry(revision, lines_added, lines_deleted,
+                                   fetched_at)
+            entries[revision] = entry
+            pending.append(entry)
 
     def has(self, revision: int) -> bool:
         """Check if revision is cached.
@@ -127,44 +175,136 @@ class SVNDiffCache:
             revisions: List of revision numbers to check.
 
         Returns:
-            List of revisions not in cache.
+            Sorted list of distinct revisions not in cache.
+        """
+        # Set difference against the entries dict runs in one C loop
+        # instead of a Python-level has() call per revision
+        return sorted(set(revisions).difference(self._entries))
+
+    def iter_uncached(self, revisions):
+        """Yield uncached revisions lazily, preserving input order.
+
+        Streaming counterpart to get_uncached_revisions: nothing is
+        materialized, and membership is checked directly against the
+        entries dict instead of going through the has() method call.
+
+        Args:
+            revisions: Iterable of revision numbers to check.
+
+        Yields:
+            Revisions not in the cache.
+        """
+        entries = self._entries
+        return (r for r in revisions if r not in entries)
+
+    def append_pending(self) -> int:
+        """Append entries put since the last persist to the journal.
+
+        Each call costs O(new entries) bytes instead of re-serializing
+        the whole cache like save() does, so periodic persistence during
+        a long fetch run stays cheap. save() later folds the journal
+        back into the base file.
+
+        Returns:
+            Number of entries appended.
         """
-        return [r for r in revisions if not self.has(r)]
+        if not self._pending:
+            return 0
+
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.journal_path, "a") as f:
+            for entry in self._pending:
+                record = entry.to_dict()
+                if orjson is not None:
+                    f.write(orjson.dumps(record).decode())
+                else:
+                    f.write(json.dumps(record))
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        appended = len(self._pending)
+        self._pending.clear()
+        return appended
 
     def save(self) -> None:
         """Persist cache to disk.
 
         Creates parent directories if needed.
         Uses atomic write (temp file + rename) for safety.
+        Compacts away the journal, since the base file now holds
+        everything.
         """
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            str(rev): entry.to_dict()
-            for rev, entry in self._entries.items()
-        }
-
         # Write to temp file first for atomic operation
         temp_path = self.cache_path.with_suffix(".tmp")
-        with open(temp_path, "w") as f:
-            json.dump(data, f, indent=2)
 
-        # Atomic rename
-        temp_path.rename(self.cache_path)
+        if orjson is not None:
+            # JSON object keys are always strings on disk, so int keys
+            # (via OPT_NON_STR_KEYS) round-trip identically while
+            # skipping the per-entry str(rev) conversion
+            data = {
+                rev: entry.to_dict()
+                for rev, entry in self._entries.items()
+            }
+            temp_path.write_bytes(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ))
+        else:
+            data = {
+                str(rev): entry.to_dict()
+                for rev, entry in self._entries.items()
+            }
+            # Large buffer collapses json.dump's many small writes
+            with open(temp_path, "w", buffering=1 << 20) as f:
+                json.dump(data, f, indent=2)
+
+        # Atomic on POSIX and Windows alike, without the extra Path
+        # wrapper rename() goes through
+        os.replace(temp_path, self.cache_path)
+
+        # Everything is in the base file now
+        self.journal_path.unlink(missing_ok=True)
+        self._pending.clear()
 
     def load(self) -> None:
         """Load cache from disk.
 
         Creates empty cache if file doesn't exist.
+        Entries in the journal (written by append_pending but not yet
+        compacted by save) are replayed on top of the base file.
         """
-        if not self.cache_path.exists():
-            self._entries = {}
-            return
+        self._pending = []
 
-        with open(self.cache_path) as f:
-            data = json.load(f)
+        if not self.cache_path.exists():
+            # Adopt a cache written under the legacy md5-derived name, so
+            # existing caches survive the blake2b switch
+            legacy = (self._cache_dir / "svn" /
+                      f"{hashlib.md5(self._repo_url.lower().encode()).hexdigest()[:12]}.json")
+            if legacy.exists():
+                legacy.rename(self.cache_path)
 
-        self._entries = {
-            int(rev): DiffCacheEntry.from_dict(entry_data)
-            for rev, entry_data in data.items()
-        }
+        if not self.cache_path.exists():
+            self._entries = {}
+        else:
+            if orjson is not None:
+                data = orjson.loads(self.cache_path.read_bytes())
+            else:
+                with open(self.cache_path) as f:
+                    data = json.load(f)
+
+            self._entries = {
+                int(rev): DiffCacheEntry.from_dict(entry_data)
+                for rev, entry_data in data.items()
+            }
+
+        if self.journal_path.exists():
+            loads = json.loads if orjson is None else orjson.loads
+            with open(self.journal_path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = DiffCacheEntry.from_dict(loads(line))
+                        self._entries[entry.revision] = entry
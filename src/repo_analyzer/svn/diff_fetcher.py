@@ -169,6 +169,7 @@ class SVNDiffFetcher:
         # Fetch uncached revisions in parallel
         if uncached:
             completed = len(results)
+            fetched = []
 
             with ThreadPoolExecutor(max_workers=workers) as executor:
                 futures = {
@@ -181,6 +182,9 @@ class SVNDiffFetcher:
                     try:
                         stats = future.result()
                         results[rev] = stats
+                        fetched.append(
+                            (rev, stats.lines_added, stats.lines_deleted)
+                        )
                     except Exception:
                         # Skip failed revisions, log could be added
                         results[rev] = DiffStats(lines_added=0, lines_deleted=0)
@@ -189,6 +193,10 @@ class SVNDiffFetcher:
                     if on_progress:
                         on_progress(completed, total)
 
+            # Cache the whole batch with one shared timestamp; failed
+            # revisions stay uncached so a later run retries them
+            self._cache.put_many(fetched)
+
         # Report final progress if we only had cached results
         if not uncached and on_progress:
             on_progress(total, total)
@@ -202,6 +210,9 @@ class SVNDiffFetcher:
     def _fetch_single(self, revision: int) -> DiffStats:
         """Fetch and parse diff for a single revision (internal helper).
 
+        Caching is left to the caller, which stores the whole batch at
+        once via put_many.
+
         Args:
             revision: SVN revision number.
 
@@ -209,9 +220,4 @@ class SVNDiffFetcher:
             DiffStats with lines_added and lines_deleted.
         """
         diff_output = self._repo.fetch_diff_for_revision(revision)
-        stats = self.parse_unified_diff(diff_output)
-
-        # Cache the result
-        self._cache.put(revision, stats.lines_added, stats.lines_deleted)
-
-        return stats
+        return self.parse_unified_diff(diff_output)
@@ -82,7 +82,9 @@ class SVNExtractor:
         msg_elem = entry.find("msg")
         message = msg_elem.text if msg_elem is not None and msg_elem.text else ""
 
-        props = extract_props(message)
+        # Stored as a tuple: the model is frozen, and the immutable
+        # sequence hashes/shares cheaply across the aggregation passes
+        props = tuple(extract_props(message))
 
         return SVNCommitData(
             revision=revision,
@@ -15,7 +15,7 @@ class SVNCommitData:
         author: Username of the committer.
         commit_date: Timestamp of the commit.
         message: Full commit message text.
-        props: List of usernames from Props attribution line.
+        props: Usernames from the Props attribution line.
         lines_added: Number of lines added (None if not fetched).
         lines_deleted: Number of lines deleted (None if not fetched).
     """
@@ -24,7 +24,7 @@ class SVNCommitData:
     author: str
     commit_date: datetime
     message: str
-    props: list[str]
+    props: tuple[str, ...]
     lines_added: Optional[int] = None
     lines_deleted: Optional[int] = None
 
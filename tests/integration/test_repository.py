@@ -101,6 +101,192 @@ def test_get_commits_passes_date_range(cache_dir):
         assert call_kwargs['to'] == end
 
 
+@pytest.mark.integration
+def test_get_commits_passes_traversal_filters(cache_dir):
+    """Test that get_commits forwards traversal filters to PyDriller."""
+    import inspect
+    from pydriller import Repository
+    from repo_analyzer.repository import WordPressRepository
+    from unittest.mock import patch
+
+    repo = WordPressRepository(cache_dir)
+
+    # Mock Repository
+    with patch('repo_analyzer.repository.Repository') as mock_repository:
+        start = datetime(2005, 4, 1, 0, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2005, 4, 30, 0, 0, 0, tzinfo=timezone.utc)
+
+        # Call get_commits with filters
+        list(repo.get_commits(
+            since=start, to=end,
+            only_no_merges=True,
+            only_in_branch='trunk',
+            only_modifications_with_file_types=['.php'],
+        ))
+
+        call_kwargs = mock_repository.call_args[1]
+
+        # Every kwarg must exist on the real (unmocked) PyDriller
+        # constructor, so a renamed parameter can't hide behind the mock
+        valid_params = set(inspect.signature(Repository.__init__).parameters)
+        assert set(call_kwargs) <= valid_params
+
+        assert call_kwargs['only_no_merge'] is True
+        assert call_kwargs['only_in_branch'] == 'trunk'
+        assert call_kwargs['only_modifications_with_file_types'] == ['.php']
+
+
+@pytest.mark.integration
+def test_get_commits_filters_default_off(cache_dir):
+    """Test that traversal filters stay disabled by default."""
+    from repo_analyzer.repository import WordPressRepository
+    from unittest.mock import patch
+
+    repo = WordPressRepository(cache_dir)
+
+    with patch('repo_analyzer.repository.Repository') as mock_repository:
+        start = datetime(2005, 4, 1, 0, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2005, 4, 30, 0, 0, 0, tzinfo=timezone.utc)
+
+        list(repo.get_commits(since=start, to=end))
+
+        call_kwargs = mock_repository.call_args[1]
+
+        assert call_kwargs['only_no_merge'] is False
+        assert call_kwargs['only_in_branch'] is None
+        assert call_kwargs['only_modifications_with_file_types'] is None
+
+
+@pytest.mark.integration
+def test_get_commits_fast_parses_numstat(cache_dir, tmp_path):
+    """Test that get_commits_fast yields correct stats from a real repo."""
+    import subprocess
+    from repo_analyzer.repository import GitRepository
+
+    # Build a tiny repository with two commits
+    repo_dir = tmp_path / "tiny"
+    repo_dir.mkdir()
+
+    def git(*args, **env_dates):
+        env = {
+            "GIT_AUTHOR_NAME": "Alice", "GIT_AUTHOR_EMAIL": "a@example.com",
+            "GIT_COMMITTER_NAME": "Alice", "GIT_COMMITTER_EMAIL": "a@example.com",
+            "GIT_AUTHOR_DATE": env_dates.get("date", "2005-04-05T12:00:00 +0000"),
+            "GIT_COMMITTER_DATE": env_dates.get("date", "2005-04-05T12:00:00 +0000"),
+            "HOME": str(tmp_path),
+        }
+        subprocess.run(["git", "-C", str(repo_dir)] + list(args),
+                       check=True, capture_output=True, env=env)
+
+    git("init")
+    (repo_dir / "a.txt").write_text("one\ntwo\nthree\n")
+    git("add", "a.txt")
+    git("commit", "-m", "first")
+    (repo_dir / "a.txt").write_text("one\nthree\n")
+    git("add", "a.txt")
+    git("commit", "-m", "second", date="2005-04-06T12:00:00 +0000")
+
+    repo = GitRepository("unused://url", cache_dir, "tiny")
+    repo.repo_path = repo_dir
+
+    start = datetime(2005, 4, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2005, 4, 30, 0, 0, 0, tzinfo=timezone.utc)
+
+    commits = list(repo.get_commits_fast(since=start, to=end))
+
+    # --reverse yields oldest first, like the PyDriller traversal
+    assert len(commits) == 2
+    first, second = commits
+
+    assert first.author.name == "Alice"
+    assert first.insertions == 3
+    assert first.deletions == 0
+    assert first.author_date == datetime(2005, 4, 5, 12, 0, 0,
+                                         tzinfo=timezone.utc)
+
+    assert second.insertions == 0
+    assert second.deletions == 1
+
+
+@pytest.mark.integration
+def test_get_commits_fast_matches_pydriller_with_merge(cache_dir, tmp_path):
+    """Test that the fast path matches PyDriller on a merge history."""
+    import subprocess
+    from repo_analyzer.repository import GitRepository
+
+    repo_dir = tmp_path / "merged"
+    repo_dir.mkdir()
+
+    def git(*args, date="2005-04-05T12:00:00 +0000"):
+        env = {
+            "GIT_AUTHOR_NAME": "Alice", "GIT_AUTHOR_EMAIL": "a@example.com",
+            "GIT_COMMITTER_NAME": "Alice", "GIT_COMMITTER_EMAIL": "a@example.com",
+            "GIT_AUTHOR_DATE": date,
+            "GIT_COMMITTER_DATE": date,
+            "HOME": str(tmp_path),
+        }
+        subprocess.run(["git", "-C", str(repo_dir)] + list(args),
+                       check=True, capture_output=True, env=env)
+
+    git("init")
+    (repo_dir / "a.txt").write_text("one\n")
+    git("add", "a.txt")
+    git("commit", "-m", "first")
+    git("checkout", "-q", "-b", "feature")
+    (repo_dir / "b.txt").write_text("two\nthree\n")
+    git("add", "b.txt")
+    git("commit", "-m", "branch work", date="2005-04-06T12:00:00 +0000")
+    git("checkout", "-q", "-")
+    git("merge", "--no-ff", "-m", "merge feature", "feature",
+        date="2005-04-07T12:00:00 +0000")
+
+    repo = GitRepository("unused://url", cache_dir, "merged")
+    repo.repo_path = repo_dir
+
+    start = datetime(2005, 4, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2005, 4, 30, 0, 0, 0, tzinfo=timezone.utc)
+
+    fast = [
+        (c.hash, c.author.name, c.insertions, c.deletions)
+        for c in repo.get_commits_fast(since=start, to=end)
+    ]
+    pydriller = [
+        (c.hash, c.author.name, c.insertions, c.deletions)
+        for c in repo.get_commits(since=start, to=end)
+    ]
+
+    # Same commits, same order, and the merge commit carries its
+    # first-parent diff stats (+2 for b.txt) on both paths
+    assert fast == pydriller
+    assert fast[-1][2:] == (2, 0)
+
+
+@pytest.mark.integration
+def test_get_commits_fast_compatible_with_extractor(cache_dir):
+    """Test that fast-path commits satisfy the CommitExtractor interface."""
+    from repo_analyzer.repository import _FastCommit
+    from repo_analyzer.extractor import CommitExtractor
+    from unittest.mock import MagicMock
+
+    commit = _FastCommit(
+        "abc123", "Alice",
+        datetime(2005, 4, 5, 12, 0, 0, tzinfo=timezone.utc)
+    )
+    commit.insertions = 10
+    commit.deletions = 2
+
+    version_mapper = MagicMock()
+    version_mapper.get_version_for_commit.return_value = "1.5"
+
+    data = CommitExtractor(version_mapper).extract(commit)
+
+    assert data.hash == "abc123"
+    assert data.author_name == "Alice"
+    assert data.lines_added == 10
+    assert data.lines_deleted == 2
+    assert data.version == "1.5"
+
+
 @pytest.mark.integration
 def test_repository_url_constant():
     """Test that WordPress repository URL is defined."""
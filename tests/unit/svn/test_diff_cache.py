@@ -216,6 +216,56 @@ class TestSVNDiffCache:
 
         assert uncached == [100, 200, 300]
 
+    def test_append_pending_journals_new_entries(self, tmp_path):
+        """append_pending writes only new entries to the journal."""
+        cache = SVNDiffCache(tmp_path, "https://example.com/repo/")
+        cache.put(100, lines_added=10, lines_deleted=5)
+
+        appended = cache.append_pending()
+
+        assert appended == 1
+        assert cache.journal_path.exists()
+        assert not cache.cache_path.exists()
+
+        # Nothing new: journal unchanged
+        assert cache.append_pending() == 0
+
+    def test_load_replays_journal(self, tmp_path):
+        """Journaled entries survive a reload without a save."""
+        cache = SVNDiffCache(tmp_path, "https://example.com/repo/")
+        cache.put(100, lines_added=10, lines_deleted=5)
+        cache.save()
+        cache.put(200, lines_added=20, lines_deleted=10)
+        cache.append_pending()
+
+        fresh = SVNDiffCache(tmp_path, "https://example.com/repo/")
+        fresh.load()
+
+        assert fresh.get(100).lines_added == 10
+        assert fresh.get(200).lines_added == 20
+
+    def test_save_compacts_journal(self, tmp_path):
+        """save folds the journal into the base file and removes it."""
+        cache = SVNDiffCache(tmp_path, "https://example.com/repo/")
+        cache.put(100, lines_added=10, lines_deleted=5)
+        cache.append_pending()
+
+        cache.save()
+
+        assert cache.cache_path.exists()
+        assert not cache.journal_path.exists()
+
+    def test_iter_uncached_is_lazy(self, tmp_path):
+        """iter_uncached yields uncached revisions without materializing."""
+        cache = SVNDiffCache(tmp_path, "https://example.com/repo/")
+        cache.put(200, lines_added=20, lines_deleted=10)
+
+        result = cache.iter_uncached(iter([100, 200, 300]))
+
+        # Generator, not a list
+        assert iter(result) is iter(result)
+        assert list(result) == [100, 300]
+
     def test_cache_size(self, tmp_path):
         """Returns number of cached entries."""
         cache = SVNDiffCache(tmp_path, "https://example.com/repo/")
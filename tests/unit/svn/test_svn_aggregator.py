@@ -204,6 +204,60 @@ class TestSVNRollingWindowAggregator:
         # unique props: shared_prop, unique1, unique2 = 3
         assert result[0].unique_props_contributors == 3
 
+    def test_rolling_window_authors_expire_with_their_weeks(self):
+        """Authors drop out of the unique count once their weeks expire."""
+        aggregator = SVNRollingWindowAggregator()
+
+        # One author only in the first week, another in every week
+        base_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        commits = [
+            make_commit(100, "early_bird", base_date, props=["early_prop"]),
+        ]
+        for week in range(14):
+            commits.append(
+                make_commit(
+                    200 + week, "regular",
+                    base_date + timedelta(weeks=week),
+                    props=["regular_prop"]
+                )
+            )
+
+        weekly_agg = SVNWeeklyAggregator()
+        weekly_results = weekly_agg.aggregate(commits)
+        result = aggregator.aggregate(commits, weekly_results)
+
+        # First window sees both authors; once week 0 slides out only
+        # the regular contributor remains
+        assert result[0].unique_authors == 2
+        assert result[0].unique_props_contributors == 2
+        assert result[1].unique_authors == 1
+        assert result[1].unique_props_contributors == 1
+
+    def test_aggregate_weekly_matches_aggregate(self):
+        """aggregate_weekly on retained per-week sets matches aggregate."""
+        base_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        commits = [
+            make_commit(
+                100 + week, f"user{week % 3}",
+                base_date + timedelta(weeks=week),
+                props=[f"prop{week % 4}"]
+            )
+            for week in range(14)
+        ]
+
+        weekly_agg = SVNWeeklyAggregator()
+        weekly_results = weekly_agg.aggregate(commits)
+
+        aggregator = SVNRollingWindowAggregator()
+        from_commits = aggregator.aggregate(commits, weekly_results)
+        from_weekly = aggregator.aggregate_weekly(
+            weekly_results,
+            weekly_agg.authors_by_week,
+            weekly_agg.props_by_week,
+        )
+
+        assert from_weekly == from_commits
+
 
 class TestContributorTracker:
     """Tests for ContributorTracker class."""
@@ -139,8 +139,8 @@ Update copyright year to 2024.</msg>
         extractor = SVNExtractor()
         commits = extractor.parse_commits_xml(self.SAMPLE_XML)
 
-        assert commits[0].props == ["joelcj91", "mukesh27"]
-        assert commits[1].props == []
+        assert commits[0].props == ("joelcj91", "mukesh27")
+        assert commits[1].props == ()
 
     def test_parse_empty_log(self):
         """SVNExtractor handles empty log."""
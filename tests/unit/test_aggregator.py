@@ -288,3 +288,93 @@ def test_aggregate_results_sorted_by_week():
     # Should return 3 weeks in chronological order
     assert len(result) == 3
     assert result[0].week_start < result[1].week_start < result[2].week_start
+
+def test_aggregate_stream_yields_per_week(sample_commits):
+    """Test that streaming aggregation yields one aggregate per week."""
+    from repo_analyzer.aggregator import WeeklyAggregator
+
+    aggregator = WeeklyAggregator()
+    sorted_commits = sorted(sample_commits, key=lambda c: c.commit_date)
+    result = list(aggregator.aggregate_stream(sorted_commits))
+
+    # Streaming over sorted input matches the list-based aggregation
+    assert result == aggregator.aggregate(sample_commits)
+
+
+def test_aggregate_stream_empty():
+    """Test streaming aggregation over an empty iterable."""
+    from repo_analyzer.aggregator import WeeklyAggregator
+
+    aggregator = WeeklyAggregator()
+    result = list(aggregator.aggregate_stream(iter([])))
+
+    assert result == []
+
+
+def test_aggregate_stream_is_lazy():
+    """Test that aggregates are yielded as week boundaries are crossed."""
+    from repo_analyzer.aggregator import WeeklyAggregator
+    from repo_analyzer.models import CommitData
+
+    commits = [
+        CommitData(
+            hash="week1",
+            author_name="Author 1",
+            commit_date=datetime(2005, 4, 5, 12, 0, 0, tzinfo=timezone.utc),
+            lines_added=10,
+            lines_deleted=5,
+            version=None
+        ),
+        CommitData(
+            hash="week2",
+            author_name="Author 2",
+            commit_date=datetime(2005, 4, 12, 12, 0, 0, tzinfo=timezone.utc),
+            lines_added=20,
+            lines_deleted=10,
+            version=None
+        ),
+    ]
+
+    aggregator = WeeklyAggregator()
+    stream = aggregator.aggregate_stream(iter(commits))
+
+    # The first week is complete as soon as the second week's commit arrives
+    first = next(stream)
+    assert first.week_start == datetime(2005, 4, 4, 0, 0, 0, tzinfo=timezone.utc)
+    assert first.total_commits == 1
+
+    second = next(stream)
+    assert second.week_start == datetime(2005, 4, 11, 0, 0, 0, tzinfo=timezone.utc)
+
+    with pytest.raises(StopIteration):
+        next(stream)
+
+
+def test_update_finalize_matches_aggregate(sample_commits):
+    """Test that incremental update/finalize matches batch aggregation."""
+    from repo_analyzer.aggregator import WeeklyAggregator
+
+    batch = WeeklyAggregator()
+    expected = batch.aggregate(sample_commits)
+
+    streaming = WeeklyAggregator()
+    for commit in sample_commits:
+        streaming.update(commit)
+    result = streaming.finalize()
+
+    assert result == expected
+    # Per-week author sets are exposed for rolling-window dedup
+    assert streaming.authors_by_week.keys() == batch.commits_by_week.keys()
+
+
+def test_finalize_resets_accumulators(sample_commits):
+    """Test that finalize clears state for a fresh round of updates."""
+    from repo_analyzer.aggregator import WeeklyAggregator
+
+    aggregator = WeeklyAggregator()
+    for commit in sample_commits:
+        aggregator.update(commit)
+    first = aggregator.finalize()
+
+    assert len(first) == 2
+    assert aggregator.finalize() == []
@@ -197,3 +197,24 @@ class TestRepositoryNameInference:
         name = infer_repo_name_from_url(url)
 
         assert name == "node"
+
+
+class TestParseDate:
+    """Tests for parse_date helper."""
+
+    def test_parse_date_returns_utc_midnight(self):
+        """Test parsed dates are pinned to UTC midnight."""
+        from datetime import datetime, timezone
+        from repo_analyzer.cli import parse_date
+
+        result = parse_date("2024-06-15")
+
+        assert result == datetime(2024, 6, 15, tzinfo=timezone.utc)
+        assert result.tzinfo == timezone.utc
+
+    def test_parse_date_rejects_invalid_format(self):
+        """Test invalid date strings raise ValueError."""
+        from repo_analyzer.cli import parse_date
+
+        with pytest.raises(ValueError, match="Expected YYYY-MM-DD"):
+            parse_date("15/06/2024")
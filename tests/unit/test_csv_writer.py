@@ -616,3 +616,61 @@ def test_write_rolling_aggregates_utf8_encoding(output_dir):
     with open(output_path, 'r', encoding='utf-8') as f:
         content = f.read()
         assert len(content) > 0
+
+def test_write_commits_parquet_round_trip(output_dir, sample_commits):
+    """Test that Parquet output preserves commit data and types."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    from repo_analyzer.csv_writer import CSVWriter
+
+    output_path = output_dir / "commits.parquet"
+    CSVWriter.write_commits_parquet(sample_commits, output_path)
+
+    assert output_path.exists()
+
+    table = pq.read_table(output_path)
+    assert table.num_rows == 4
+    assert table.column_names == [
+        'hash',
+        'author_name',
+        'commit_date',
+        'lines_added',
+        'lines_deleted',
+        'version'
+    ]
+
+    rows = table.to_pylist()
+    assert rows[0]['hash'] == sample_commits[0].hash
+    assert rows[0]['author_name'] == sample_commits[0].author_name
+    assert rows[0]['lines_added'] == sample_commits[0].lines_added
+    # None versions survive as nulls rather than empty strings
+    assert rows[1]['version'] is None
+
+
+def test_write_commits_by_year_parquet_format(tmp_path):
+    """Test that write_commits_by_year emits Parquet when requested."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    from repo_analyzer.csv_writer import CSVWriter
+    from repo_analyzer.models import CommitData
+
+    commits = [
+        CommitData(
+            hash="commit1",
+            author_name="Author",
+            commit_date=datetime(2024, 6, 10, 16, 0, 0, tzinfo=timezone.utc),
+            lines_added=40,
+            lines_deleted=20,
+            version=None
+        ),
+    ]
+
+    CSVWriter.write_commits_by_year(
+        commits, tmp_path / "data", "WordPress", file_format='parquet'
+    )
+
+    parquet_path = tmp_path / "data" / "WordPress" / "2024" / "commits.parquet"
+    assert parquet_path.exists()
+    assert pq.read_table(parquet_path).num_rows == 1
@@ -80,6 +80,97 @@ class TestGitRepository:
         assert hasattr(repo, '_is_valid_repo')
         assert callable(repo._is_valid_repo)
 
+    def test_num_workers_defaults_to_one(self, tmp_path):
+        """Test GitRepository defaults to single-worker traversal."""
+        repo = GitRepository("https://github.com/test/test.git", tmp_path, "test")
+
+        assert repo.num_workers == 1
+
+    def test_num_workers_configurable(self, tmp_path):
+        """Test GitRepository stores a custom worker count."""
+        repo = GitRepository(
+            "https://github.com/test/test.git", tmp_path, "test", num_workers=4
+        )
+
+        assert repo.num_workers == 4
+
+    def test_shallow_since_defaults_to_none(self, tmp_path):
+        """Test GitRepository defaults to full (non-shallow) clones."""
+        repo = GitRepository("https://github.com/test/test.git", tmp_path, "test")
+
+        assert repo.shallow_since is None
+
+    def test_shallow_since_used_in_clone_command(self, tmp_path):
+        """Test that ensure_cloned requests a shallow clone when configured."""
+        from datetime import datetime, timezone
+        from unittest.mock import patch
+
+        repo = GitRepository(
+            "https://github.com/test/test.git", tmp_path, "test",
+            shallow_since=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+
+        with patch('repo_analyzer.repository.subprocess.run') as mock_run:
+            repo.ensure_cloned()
+
+        clone_cmd = mock_run.call_args_list[0][0][0]
+        assert "--shallow-since=2024-01-01" in clone_cmd
+
+    def test_ensure_cloned_skips_pull_when_cache_covers_end_date(self, tmp_path):
+        """Test that a cache covering end_date avoids the pull entirely."""
+        from datetime import datetime, timezone
+        from unittest.mock import patch, MagicMock
+
+        repo = GitRepository("https://github.com/test/test.git", tmp_path, "test")
+        (repo.repo_path / ".git").mkdir(parents=True)
+
+        log_result = MagicMock()
+        log_result.stdout = "2024-06-01T12:00:00+00:00\n"
+
+        with patch('repo_analyzer.repository.subprocess.run',
+                   return_value=log_result) as mock_run:
+            repo.ensure_cloned(
+                end_date=datetime(2024, 1, 1, tzinfo=timezone.utc)
+            )
+
+        # Only the `git log -1` probe should have run - no pull
+        commands = [call[0][0] for call in mock_run.call_args_list]
+        assert len(commands) == 1
+        assert "log" in commands[0]
+
+    def test_ensure_cloned_pulls_when_cache_is_stale(self, tmp_path):
+        """Test that an out-of-date cache still triggers a pull."""
+        from datetime import datetime, timezone
+        from unittest.mock import patch, MagicMock
+
+        repo = GitRepository("https://github.com/test/test.git", tmp_path, "test")
+        (repo.repo_path / ".git").mkdir(parents=True)
+
+        log_result = MagicMock()
+        log_result.stdout = "2023-06-01T12:00:00+00:00\n"
+
+        with patch('repo_analyzer.repository.subprocess.run',
+                   return_value=log_result) as mock_run:
+            repo.ensure_cloned(
+                end_date=datetime(2024, 1, 1, tzinfo=timezone.utc)
+            )
+
+        commands = [call[0][0] for call in mock_run.call_args_list]
+        assert any("pull" in cmd for cmd in commands)
+
+    def test_ensure_cloned_no_fetch_skips_pull(self, tmp_path):
+        """Test that no_fetch suppresses the pull unconditionally."""
+        from unittest.mock import patch
+
+        repo = GitRepository("https://github.com/test/test.git", tmp_path, "test")
+        (repo.repo_path / ".git").mkdir(parents=True)
+
+        with patch('repo_analyzer.repository.subprocess.run') as mock_run:
+            path = repo.ensure_cloned(no_fetch=True)
+
+        assert path == repo.repo_path
+        mock_run.assert_not_called()
+
 
 class TestWordPressRepository:
     """Tests for WordPressRepository subclass."""
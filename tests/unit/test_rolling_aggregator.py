@@ -272,3 +272,19 @@ def test_rolling_aggregate_multiple_authors_deduplication():
 
     # First window should have 3 unique authors (Alice, Bob, Charlie)
     assert rolling_windows[0].unique_authors == 3
+
+
+def test_aggregate_weekly_matches_aggregate(sample_commits_12_weeks):
+    """Test that the commit-free path matches commit-based aggregation."""
+    from repo_analyzer.aggregator import WeeklyAggregator
+
+    weekly_aggregator = WeeklyAggregator()
+    weekly_aggregates = weekly_aggregator.aggregate(sample_commits_12_weeks)
+
+    aggregator = RollingWindowAggregator()
+    expected = aggregator.aggregate(sample_commits_12_weeks, weekly_aggregates)
+    result = aggregator.aggregate_weekly(
+        weekly_aggregates, weekly_aggregator.authors_by_week
+    )
+
+    assert result == expected